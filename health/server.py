@@ -8,18 +8,33 @@ Endpoints:
 Environment variables:
     COOKIE_DIR: Path to cookie files. Default: /cookies
     HEALTH_PORT: Port to listen on. Default: 8081
+    HEALTH_CACHE_TTL: Seconds to reuse an encoded /health response. Default: 1.0
+    HEALTH_WORKERS: Maximum concurrently handled connections. Default: 8
+    HEALTH_DEADLINE_MS: Time budget for reading cookie files; sites not read in
+        time report "unknown". /health returns 503 after twice this. Default: 500
+    HEALTH_STATUS_WORKERS: Threads reading cookie files in parallel. Default: 8
+    HEALTH_KEEPALIVE_MS: How long an idle keep-alive connection may hold a
+        worker before it is closed. Default: 200
     LOG_LEVEL: Logging verbosity. Default: INFO
 """
 from __future__ import annotations
 
-import json
+import functools
+import gzip
+import hashlib
 import logging
+import math
+import mimetypes
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
-from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
+import orjson
 import structlog
 
 structlog.configure(
@@ -35,76 +50,263 @@ EXPIRING_THRESHOLD_SECONDS = 24 * 3600
 _STATIC_DIR = Path(__file__).parent / "static"
 
 
-def get_site_status(cookie_file: Path) -> dict:
+def _load_static(static_dir: Path) -> dict[str, tuple[bytes, bytes, str]]:
+    """Read static files once at startup.
+
+    Args:
+        static_dir: Directory of files to serve.
+
+    Returns:
+        Mapping of filename to (raw_body, gzipped_body, content_type).
+    """
+    files: dict[str, tuple[bytes, bytes, str]] = {}
+    if not static_dir.is_dir():
+        return files
+    for path in static_dir.iterdir():
+        if path.is_file():
+            raw = path.read_bytes()
+            content_type = (
+                mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+            )
+            files[path.name] = (raw, gzip.compress(raw, mtime=0), content_type)
+    return files
+
+
+_STATIC = _load_static(_STATIC_DIR)
+
+# Parsed cookie files keyed by path, invalidated on (mtime_ns, size) change.
+_PARSE_CACHE_MAX_ENTRIES = 256
+_PARSE_CACHE: OrderedDict[str, tuple[int, int, dict]] = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Parses in progress, so concurrent cache misses for one file share a read.
+_INFLIGHT: dict[str, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _read_json(path: str | Path) -> tuple[os.stat_result, dict]:
+    """Read and parse a JSON file, taking its stat from the open fd.
+
+    Returns:
+        Tuple of (stat of the file that was read, parsed contents).
+    """
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        # read() loops until EOF; a single os.read may come back short on
+        # network or FUSE filesystems.
+        raw = f.read()
+    return st, orjson.loads(raw)
+
+
+def _read_json_once(path: str) -> tuple[os.stat_result, dict]:
+    """Read and parse path, letting concurrent callers share one read.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        Tuple of (stat, parsed contents) from _read_json. A read error is
+        raised in every waiting caller.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(path)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[path] = Future()
+    if not leader:
+        return future.result()
+
+    try:
+        result = _read_json(path)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[path]
+
+
+def _load_cookie_data(cookie_file: str | Path | os.DirEntry) -> dict:
+    """Return parsed JSON for a cookie file, reusing the cached parse if unchanged.
+
+    The file is only stat'ed when a cached parse exists to validate; a cold
+    miss goes straight to the read, which takes its stat from the open fd.
+
+    Args:
+        cookie_file: Path to {domain}.json, or its os.scandir entry.
+
+    Returns:
+        Parsed file contents.
+    """
+    key = os.fspath(cookie_file)
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+    if cached is not None:
+        # DirEntry.stat() is cached from the scan where the OS allows it.
+        st = os.stat(key) if isinstance(cookie_file, str) else cookie_file.stat()
+        if cached[:2] == (st.st_mtime_ns, st.st_size):
+            with _PARSE_CACHE_LOCK:
+                if key in _PARSE_CACHE:
+                    _PARSE_CACHE.move_to_end(key)
+            return cached[2]
+
+    # Key the cache on the fstat of the bytes actually read, which may be
+    # newer than the caller's stat if the file was replaced in between.
+    st, data = _read_json_once(key)
+
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+        _PARSE_CACHE.move_to_end(key)
+        if len(_PARSE_CACHE) > _PARSE_CACHE_MAX_ENTRIES:
+            _PARSE_CACHE.popitem(last=False)
+    return data
+
+
+# Encoded /health response: (created_at, body, overall_status, etag).
+_RESPONSE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "1.0"))
+_RESPONSE_CACHE: tuple[float, bytes, str, str] | None = None
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+_WORKERS = int(os.getenv("HEALTH_WORKERS", "8"))
+_DEADLINE_SECONDS = float(os.getenv("HEALTH_DEADLINE_MS", "500")) / 1000
+# Idle keep-alive connections pin a worker; keep them far below probe timeouts.
+_KEEPALIVE_SECONDS = float(os.getenv("HEALTH_KEEPALIVE_MS", "200")) / 1000
+# Builds /health off the request thread so a stalled directory listing cannot
+# hold a request much past its deadline.
+_HEALTH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="health-status")
+# Reads individual cookie files so one slow file only delays its own site.
+_STATUS_POOL = ThreadPoolExecutor(
+    max_workers=int(os.getenv("HEALTH_STATUS_WORKERS", "8")),
+    thread_name_prefix="health-site",
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _iso_z_seconds(seconds: int) -> str:
+    return datetime.fromtimestamp(seconds, tz=UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _iso_z(ts: float) -> str:
+    """Format a Unix timestamp as second-resolution ISO 8601 UTC ("...Z")."""
+    return _iso_z_seconds(int(ts))
+
+
+def _last_refresh(metadata: dict) -> str | None:
+    """Render metadata refreshed_at (epoch, or legacy ISO string) as ISO 8601."""
+    refreshed_at = metadata.get("refreshed_at")
+    if isinstance(refreshed_at, int | float) and not isinstance(refreshed_at, bool):
+        return _iso_z(refreshed_at)
+    return refreshed_at
+
+
+def get_site_status(
+    cookie_file: str | Path | os.DirEntry,
+    now: float | None = None,
+) -> dict:
     """Calculate status for a single site from its cookie file.
 
     Args:
-        cookie_file: Path to {domain}.json.
+        cookie_file: Path to {domain}.json, or its os.scandir entry.
+        now: Unix time to evaluate expiry against. Defaults to time.time().
 
     Returns:
         Status dict with keys: status, cookies_count, cookies_valid_until, etc.
     """
     try:
-        with cookie_file.open() as f:
-            data = json.load(f)
+        data = _load_cookie_data(cookie_file)
 
         cookies = data.get("cookies", [])
         metadata = data.get("metadata", {})
-        now = time.time()
-        valid = [c for c in cookies if c.get("expires", -1) > now]
-
-        if not valid:
+        if now is None:
+            now = time.time()
+        count = 0
+        min_expiry = math.inf
+        for c in cookies:
+            expires = c.get("expires", -1)
+            if expires > now:
+                count += 1
+                if expires < min_expiry:
+                    min_expiry = expires
+
+        if count == 0:
             return {
                 "status": "expired",
                 "cookies_count": 0,
                 "cookies_valid_until": None,
                 "time_remaining_hours": 0.0,
-                "last_refresh": metadata.get("refreshed_at"),
+                "last_refresh": _last_refresh(metadata),
                 "next_refresh": metadata.get("next_refresh"),
                 "session_cookie_workaround": metadata.get(
                     "session_cookie_workaround", False
                 ),
             }
 
-        min_expiry = min(c["expires"] for c in valid)
         time_remaining = min_expiry - now
-        valid_until = (
-            datetime.fromtimestamp(min_expiry, tz=UTC)
-            .isoformat()
-            .replace("+00:00", "Z")
-        )
+        valid_until = _iso_z(min_expiry)
         status = "expiring" if time_remaining < EXPIRING_THRESHOLD_SECONDS else "ok"
 
         return {
             "status": status,
-            "cookies_count": len(valid),
+            "cookies_count": count,
             "cookies_valid_until": valid_until,
             "time_remaining_hours": round(time_remaining / 3600, 1),
-            "last_refresh": metadata.get("refreshed_at"),
+            "last_refresh": _last_refresh(metadata),
             "next_refresh": metadata.get("next_refresh"),
             "session_cookie_workaround": metadata.get(
                 "session_cookie_workaround", False
             ),
         }
-    except (json.JSONDecodeError, ValueError, KeyError) as exc:
-        logger.error("site_status_error", cookie_file=str(cookie_file), error=str(exc))
+    except (orjson.JSONDecodeError, ValueError, KeyError, TypeError, OSError) as exc:
+        logger.error(
+            "site_status_error", cookie_file=os.fspath(cookie_file), error=str(exc)
+        )
         return {"status": "error", "error": str(exc)}
 
 
 def get_health_status(cookie_dir: Path) -> dict:
     """Build complete health response from all cookie files.
 
+    Cookie files are read in parallel. Sites whose file is not read within
+    HEALTH_DEADLINE_MS are reported as "unknown" rather than delaying the
+    whole response.
+
     Args:
         cookie_dir: Directory containing {domain}.json files.
 
     Returns:
         Dict with overall status and per-site details.
     """
-    sites: dict[str, dict] = {}
+    now = time.time()
+    try:
+        with os.scandir(cookie_dir) as it:
+            entries = [
+                e
+                for e in it
+                if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        entries = []  # no cookie dir yet: report like an empty one
+    futures = {
+        _STATUS_POOL.submit(get_site_status, e, now): e.name.removesuffix(".json")
+        for e in entries
+    }
 
-    for cookie_file in sorted(cookie_dir.glob("*.json")):
-        domain = cookie_file.stem
-        sites[domain] = get_site_status(cookie_file)
+    results: dict[str, dict] = {}
+    try:
+        for future in as_completed(futures, timeout=_DEADLINE_SECONDS):
+            results[futures[future]] = future.result()
+    except TimeoutError:
+        pending = [domain for domain in futures.values() if domain not in results]
+        for future, domain in futures.items():
+            if domain not in results:
+                future.cancel()
+                results[domain] = {"status": "unknown", "error": "deadline_exceeded"}
+        logger.warning("site_status_deadline_exceeded", pending=pending)
+
+    sites = {domain: results[domain] for domain in sorted(results)}
 
     statuses = {s["status"] for s in sites.values()}
     if not sites or all(s == "error" for s in statuses):
@@ -116,16 +318,60 @@ def get_health_status(cookie_dir: Path) -> dict:
 
     return {
         "status": overall,
-        "timestamp": datetime.now(tz=UTC).isoformat().replace("+00:00", "Z"),
+        "timestamp": _iso_z(now),
         "sites": sites,
     }
 
 
+def get_health_response(cookie_dir: Path) -> tuple[bytes, str, str]:
+    """Return the encoded health response, recomputing at most once per TTL.
+
+    Args:
+        cookie_dir: Directory containing {domain}.json files.
+
+    Returns:
+        Tuple of (body, overall_status, etag).
+    """
+    global _RESPONSE_CACHE
+    with _RESPONSE_CACHE_LOCK:
+        now = time.monotonic()
+        if _RESPONSE_CACHE is not None and now - _RESPONSE_CACHE[0] < _RESPONSE_TTL:
+            return _RESPONSE_CACHE[1:]
+
+        health_data = get_health_status(cookie_dir)
+        body = orjson.dumps(health_data, option=orjson.OPT_INDENT_2)
+        # Weak validator over status and sites only: the per-second timestamp
+        # would otherwise change the tag on every recompute.
+        digest = hashlib.blake2b(
+            orjson.dumps([health_data["status"], health_data["sites"]]),
+            digest_size=16,
+        ).hexdigest()
+        etag = f'W/"{digest}"'
+        _RESPONSE_CACHE = (now, body, health_data["status"], etag)
+        return body, health_data["status"], etag
+
+
 class HealthHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for the health endpoint."""
+    """HTTP request handler for the health endpoint.
 
+    Speaks HTTP/1.1 so pollers can keep their connection open between
+    back-to-back scrapes. A new connection gets `timeout` seconds to send its
+    first request; after that, a connection idle for HEALTH_KEEPALIVE_MS is
+    closed so it cannot starve the fixed worker pool.
+    """
+
+    protocol_version = "HTTP/1.1"
+    timeout = 5
     cookie_dir: Path = Path(os.getenv("COOKIE_DIR", "/cookies"))
 
+    def handle(self) -> None:
+        """Serve requests on this connection with a short keep-alive idle timeout."""
+        self.close_connection = True
+        self.handle_one_request()
+        self.connection.settimeout(_KEEPALIVE_SECONDS)
+        while not self.close_connection:
+            self.handle_one_request()
+
     def log_message(self, format: str, *args: object) -> None:
         """Route access logs through structlog."""
         logger.debug("http_access", message=format % args)
@@ -135,31 +381,125 @@ class HealthHandler(BaseHTTPRequestHandler):
         if self.path in ("/", "/health"):
             self._serve_health_json()
         elif self.path == "/index.html":
-            self._serve_static("index.html", "text/html")
+            self._serve_static("index.html")
         else:
             self.send_error(404, "Not Found")
 
+    def _send(self, code: int, headers: dict[str, str], body: bytes = b"") -> None:
+        """Write status line, headers and body with a single socket write."""
+        self.log_request(code)
+        head = [
+            f"{self.protocol_version} {code} {self.responses[code][0]}",
+            f"Server: {self.version_string()}",
+            f"Date: {self.date_time_string()}",
+        ]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        self.wfile.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
     def _serve_health_json(self) -> None:
-        health_data = get_health_status(self.cookie_dir)
-        body = json.dumps(health_data, indent=2).encode()
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
-        logger.info("health_served", status=health_data["status"])
-
-    def _serve_static(self, filename: str, content_type: str) -> None:
-        static_file = _STATIC_DIR / filename
-        if not static_file.exists():
+        future = _HEALTH_POOL.submit(get_health_response, self.cookie_dir)
+        try:
+            body, status, etag = future.result(timeout=2 * _DEADLINE_SECONDS)
+        except TimeoutError:
+            self._serve_deadline_exceeded()
+            return
+
+        # If-None-Match uses weak comparison (RFC 9110 13.1.2).
+        if_none_match = self.headers.get("If-None-Match", "")
+        opaque_tag = etag.removeprefix("W/")
+        if opaque_tag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ):
+            self._send(304, {"ETag": etag})
+            logger.debug("health_not_modified", status=status)
+            return
+
+        self._send(
+            200,
+            {
+                "Content-Type": "application/json",
+                "Content-Length": str(len(body)),
+                "ETag": etag,
+            },
+            body,
+        )
+        logger.info("health_served", status=status)
+
+    def _serve_deadline_exceeded(self) -> None:
+        body = orjson.dumps(
+            {
+                "status": "error",
+                "error": "deadline_exceeded",
+                "timestamp": _iso_z(time.time()),
+                "sites": {},
+            },
+            option=orjson.OPT_INDENT_2,
+        )
+        self._send(
+            503,
+            {"Content-Type": "application/json", "Content-Length": str(len(body))},
+            body,
+        )
+        logger.warning("health_deadline_exceeded", deadline_seconds=_DEADLINE_SECONDS)
+
+    def _serve_static(self, filename: str) -> None:
+        static = _STATIC.get(filename)
+        if static is None:
             self.send_error(404, "Static file not found")
             return
-        body = static_file.read_bytes()
-        self.send_response(200)
-        self.send_header("Content-Type", content_type)
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+        raw, gzipped, content_type = static
+        use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+        body = gzipped if use_gzip else raw
+        headers = {
+            "Content-Type": content_type,
+            "Content-Length": str(len(body)),
+            "Vary": "Accept-Encoding",
+        }
+        if use_gzip:
+            headers["Content-Encoding"] = "gzip"
+        self._send(200, headers, body)
+
+
+class BoundedThreadPoolHTTPServer(HTTPServer):
+    """HTTPServer that handles connections on a fixed-size thread pool.
+
+    Unlike ThreadingHTTPServer, a burst of connections cannot spawn an
+    unbounded number of threads: once every worker is busy the accept loop
+    waits, and new connections queue in the listen backlog.
+    """
+
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        max_workers: int = _WORKERS,
+    ) -> None:
+        super().__init__(server_address, handler_class)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="health-http"
+        )
+        self._slots = threading.BoundedSemaphore(max_workers)
+
+    def process_request(self, request, client_address) -> None:
+        """Hand the connection to a worker, blocking while all are busy."""
+        self._slots.acquire()
+        self._pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self) -> None:
+        """Close the listening socket and stop the worker pool."""
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
 
 def run_server(port: int | None = None) -> None:
@@ -169,8 +509,8 @@ def run_server(port: int | None = None) -> None:
         port: Port to listen on. Defaults to HEALTH_PORT env, then 8081.
     """
     effective_port = port or int(os.getenv("HEALTH_PORT", "8081"))
-    server = ThreadingHTTPServer(("0.0.0.0", effective_port), HealthHandler)
-    logger.info("health_server_starting", port=effective_port)
+    server = BoundedThreadPoolHTTPServer(("0.0.0.0", effective_port), HealthHandler)
+    logger.info("health_server_starting", port=effective_port, workers=_WORKERS)
     server.serve_forever()
 
 
@@ -1,12 +1,19 @@
 """Tests for the health endpoint status calculation."""
 from __future__ import annotations
 
+import gzip
+import http.client
 import json
+import os
+import threading
 import time
+import urllib.error
+import urllib.request
 from pathlib import Path
 
 import pytest
 
+from health import server
 from health.server import get_health_status, get_site_status
 
 
@@ -99,6 +106,12 @@ def test_overall_status_error_empty(cookie_dir):
     assert result["sites"] == {}
 
 
+def test_missing_cookie_dir_reports_error(tmp_path):
+    result = get_health_status(tmp_path / "absent")
+    assert result["status"] == "error"
+    assert result["sites"] == {}
+
+
 def test_tmp_files_excluded_by_glob(cookie_dir):
     """*.json glob does not match .json.tmp files — verify no false inclusion."""
     (cookie_dir / "nrc.nl.json.tmp").write_text("{}")
@@ -129,3 +142,263 @@ def test_metadata_propagated(cookie_dir):
     assert site["last_refresh"] == "2026-02-21T10:00:00Z"
     assert site["next_refresh"] == "2026-02-22T04:00:00Z"
     assert site["session_cookie_workaround"] is True
+
+
+def test_epoch_refreshed_at_rendered_as_iso(cookie_dir):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl",
+        [{"name": "s", "expires": time.time() + 48 * 3600}],
+        metadata={"refreshed_at": 1771668000},
+    )
+    result = get_health_status(cookie_dir)
+    assert result["sites"]["nrc.nl"]["last_refresh"] == "2026-02-21T10:00:00Z"
+
+
+def test_site_status_reparsed_after_rewrite(cookie_dir):
+    """Parse cache must not serve stale data once the file changes."""
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    assert get_site_status(cookie_dir / "nrc.nl.json")["status"] == "ok"
+    _write_cookie_file(
+        cookie_dir,
+        "nrc.nl",
+        [
+            {"name": "s", "expires": time.time() - 3600},
+            {"name": "t", "expires": time.time() - 3600},
+        ],
+    )
+    assert get_site_status(cookie_dir / "nrc.nl.json")["status"] == "expired"
+
+
+def test_concurrent_parse_misses_read_once(cookie_dir, monkeypatch):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    reads = []
+    real_read = server._read_json
+
+    def slow_read(path):
+        reads.append(path)
+        time.sleep(0.2)
+        return real_read(path)
+
+    monkeypatch.setattr(server, "_read_json", slow_read)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(get_site_status(cookie_dir / "nrc.nl.json"))
+        )
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(reads) == 1
+    assert [r["status"] for r in results] == ["ok"] * 5
+
+
+def test_file_deleted_after_scan_reported_as_error(cookie_dir, monkeypatch):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    _write_cookie_file(
+        cookie_dir, "fd.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    real_scandir = os.scandir
+
+    class _ScanThenDelete:
+        """os.scandir whose fd.nl.json entry goes stale before it is used."""
+
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __enter__(self):
+            entries = list(self._it)
+            (cookie_dir / "fd.nl.json").unlink()
+            return iter(entries)
+
+        def __exit__(self, *exc_info):
+            self._it.close()
+
+    monkeypatch.setattr(os, "scandir", _ScanThenDelete)
+    result = get_health_status(cookie_dir)
+    assert result["status"] == "degraded"
+    assert result["sites"]["nrc.nl"]["status"] == "ok"
+    assert result["sites"]["fd.nl"]["status"] == "error"
+
+
+def test_cold_scan_reads_without_stat(cookie_dir, monkeypatch):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    real_scandir = os.scandir
+    stats = []
+
+    class _CountingEntry:
+        def __init__(self, entry):
+            self._entry = entry
+            self.name = entry.name
+            self.path = entry.path
+
+        def __fspath__(self):
+            return self.path
+
+        def is_file(self, **kwargs):
+            return self._entry.is_file(**kwargs)
+
+        def stat(self, **kwargs):
+            stats.append(self.name)
+            return self._entry.stat(**kwargs)
+
+    class _CountingScandir:
+        def __init__(self, path):
+            self._it = real_scandir(path)
+
+        def __enter__(self):
+            return (_CountingEntry(e) for e in self._it)
+
+        def __exit__(self, *exc_info):
+            self._it.close()
+
+    monkeypatch.setattr(os, "scandir", _CountingScandir)
+    assert get_health_status(cookie_dir)["status"] == "ok"
+    assert stats == []
+    assert get_health_status(cookie_dir)["status"] == "ok"
+    assert stats == ["nrc.nl.json"]
+
+
+def test_null_expiry_reported_as_error(cookie_dir):
+    _write_cookie_file(cookie_dir, "nrc.nl", [{"name": "s", "expires": None}])
+    assert get_site_status(cookie_dir / "nrc.nl.json")["status"] == "error"
+
+
+def test_slow_site_reported_unknown(cookie_dir, monkeypatch):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    _write_cookie_file(
+        cookie_dir, "fd.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    fast_status = server.get_site_status
+
+    def slow_for_fd(path, now=None):
+        if os.fspath(path).endswith("fd.nl.json"):
+            time.sleep(0.5)
+        return fast_status(path, now)
+
+    monkeypatch.setattr(server, "get_site_status", slow_for_fd)
+    monkeypatch.setattr(server, "_DEADLINE_SECONDS", 0.1)
+    result = get_health_status(cookie_dir)
+    assert result["status"] == "degraded"
+    assert result["sites"]["nrc.nl"]["status"] == "ok"
+    assert result["sites"]["fd.nl"] == {
+        "status": "unknown",
+        "error": "deadline_exceeded",
+    }
+
+
+@pytest.fixture()
+def health_url(cookie_dir, monkeypatch):
+    """Serve HealthHandler for cookie_dir on an ephemeral port."""
+    monkeypatch.setattr(server, "_RESPONSE_CACHE", None)
+    handler = type("Handler", (server.HealthHandler,), {"cookie_dir": cookie_dir})
+    httpd = server.BoundedThreadPoolHTTPServer(("127.0.0.1", 0), handler, max_workers=2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/health"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_health_etag_not_modified(cookie_dir, health_url):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    with urllib.request.urlopen(health_url) as resp:
+        etag = resp.headers["ETag"]
+        assert json.loads(resp.read())["status"] == "ok"
+    assert etag
+
+    request = urllib.request.Request(health_url, headers={"If-None-Match": etag})
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(request)
+    assert exc_info.value.code == 304
+
+
+def test_health_etag_stable_across_recomputes(cookie_dir, health_url, monkeypatch):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    monkeypatch.setattr(server, "_RESPONSE_TTL", 0.05)
+    with urllib.request.urlopen(health_url) as resp:
+        etag = resp.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    # Cross a timestamp second so the recomputed body differs.
+    time.sleep(1.1)
+    request = urllib.request.Request(health_url, headers={"If-None-Match": etag})
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(request)
+    assert exc_info.value.code == 304
+
+
+def test_health_deadline_returns_503(health_url, monkeypatch):
+    def slow_response(cookie_dir):
+        time.sleep(0.5)
+        return b"{}", "ok", '"x"'
+
+    monkeypatch.setattr(server, "get_health_response", slow_response)
+    monkeypatch.setattr(server, "_DEADLINE_SECONDS", 0.05)
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(health_url)
+    assert exc_info.value.code == 503
+    assert json.loads(exc_info.value.read())["error"] == "deadline_exceeded"
+
+
+def test_static_served_gzipped(health_url):
+    url = health_url.replace("/health", "/index.html")
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "gzip"})
+    with urllib.request.urlopen(request) as resp:
+        assert resp.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(resp.read())
+    assert body == (Path(server.__file__).parent / "static" / "index.html").read_bytes()
+
+
+def test_keep_alive_serves_multiple_requests(cookie_dir, health_url):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    host, port = health_url.split("/")[2].split(":")
+    conn = http.client.HTTPConnection(host, int(port), timeout=5)
+    try:
+        for _ in range(2):
+            conn.request("GET", "/health")
+            resp = conn.getresponse()
+            assert resp.status == 200
+            assert json.loads(resp.read())["status"] == "ok"
+    finally:
+        conn.close()
+
+
+def test_idle_keep_alive_connections_do_not_block_new_ones(cookie_dir, health_url):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 48 * 3600}]
+    )
+    host, port = health_url.split("/")[2].split(":")
+    idle = [http.client.HTTPConnection(host, int(port), timeout=5) for _ in range(2)]
+    try:
+        # Occupy both workers with keep-alive connections, then go idle.
+        for conn in idle:
+            conn.request("GET", "/health")
+            resp = conn.getresponse()
+            resp.read()
+
+        start = time.monotonic()
+        with urllib.request.urlopen(health_url, timeout=5) as resp:
+            assert resp.status == 200
+        assert time.monotonic() - start < 1.0
+    finally:
+        for conn in idle:
+            conn.close()
@@ -2,23 +2,36 @@
 
 Usage:
     mitmdump -s addon.py
+
+Environment variables:
+    COOKIE_DIR: Path to cookie files. Default: /cookies
+    SKIP_WHEN_COOKIE_PRESENT: Leave requests that already carry a Cookie
+        header untouched. Default: false
+    LOG_LEVEL: Logging verbosity. Default: INFO
 """
 from __future__ import annotations
 
-import json
 import logging
 import os
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+import orjson
 import structlog
 from cookie_store import (
-    format_cookies,
     get_canonical_domain,
-    get_cookie_status,
-    load_cookies,
+    get_expiry_status,
+    load_cookies_cached,
 )
 from mitmproxy import http
 
+try:
+    from watchdog.observers import Observer
+except ImportError:  # watchdog is optional; fall back to periodic stat sweeps
+    Observer = None
+
 structlog.configure(
     wrapper_class=structlog.make_filtering_bound_logger(
         getattr(logging, os.getenv("LOG_LEVEL", "INFO"))
@@ -27,21 +40,154 @@ structlog.configure(
 
 logger = structlog.get_logger(__name__)
 
+SWEEP_INTERVAL_SECONDS = 5.0
+# Slow sweep alongside watchdog, for events lost on FUSE/virtiofs mounts.
+RECONCILE_INTERVAL_SECONDS = 60.0
+MISSING_TTL_SECONDS = 30.0
+_MISSING_CACHE_MAX_ENTRIES = 4096
+
+# Encoded 502 bodies keyed by (domain, reason), and headers keyed by reason.
+_ERROR_BODY_CACHE_MAX_ENTRIES = 512
+_ERROR_BODY_CACHE: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+_ERROR_HEADERS: dict[str, dict[str, str]] = {}
+
+# watchdog event types that can change a cookie file's content or existence.
+_RELOAD_EVENT_TYPES = frozenset({"created", "modified", "moved", "deleted", "closed"})
+
+
+class _CookieDirEventHandler:
+    """watchdog event handler that reloads cookie files as they change."""
+
+    def __init__(self, addon: CookieInjectorAddon) -> None:
+        self._addon = addon
+
+    def dispatch(self, event: object) -> None:
+        """Reload every {domain}.json touched by a filesystem event."""
+        if (
+            getattr(event, "is_directory", False)
+            or getattr(event, "event_type", None) not in _RELOAD_EVENT_TYPES
+        ):
+            return
+        for path in (getattr(event, "src_path", ""), getattr(event, "dest_path", "")):
+            name = os.path.basename(os.fsdecode(path))
+            if name.endswith(".json"):
+                self._addon.reload_domain(name.removesuffix(".json"))
+
 
 class CookieInjectorAddon:
     """mitmproxy addon that injects cookies into HTTP requests.
 
     Reads cookies from {COOKIE_DIR}/{domain}.json and applies
-    hybrid failure handling (ADR-0001).
+    hybrid failure handling (ADR-0001). Cookie files are loaded into memory
+    at startup and reloaded when watchdog reports a change, or by a periodic
+    stat sweep when watchdog is not installed.
     """
 
     def __init__(self) -> None:
         self.cookie_dir = Path(os.getenv("COOKIE_DIR", "/cookies"))
+        self.skip_when_present = os.getenv(
+            "SKIP_WHEN_COOKIE_PRESENT", "false"
+        ).lower() in ("1", "true", "yes")
         self._flow_status: dict[str, str] = {}
+        # domain -> time until which its cookie file is assumed missing
+        self._missing: dict[str, float] = {}
+        # domain -> (valid_cookies, header, valid_until)
+        self._cookies: dict[str, tuple[list[dict], str, float]] = {}
+        self._mtimes: dict[str, int] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._observer = None
+
+        self._sweep()
+        self._start_watching()
         logger.info("addon_initialized", cookie_dir=str(self.cookie_dir))
 
+    def done(self) -> None:
+        """Stop watching the cookie directory (mitmproxy shutdown hook)."""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def reload_domain(self, domain: str) -> None:
+        """Refresh the in-memory entry for one domain from disk."""
+        with self._lock:
+            try:
+                self._load_domain(domain)
+                self._missing.pop(domain, None)
+            except FileNotFoundError:
+                self._cookies.pop(domain, None)
+                self._mtimes.pop(domain, None)
+            except Exception as exc:
+                # Runs on watcher/sweep threads and at startup: never propagate.
+                self._cookies.pop(domain, None)
+                logger.warning("cookie_reload_failed", domain=domain, error=str(exc))
+
+    def _load_domain(self, domain: str) -> tuple[list[dict], str, float]:
+        with self._lock:
+            cookie_file = self.cookie_dir / f"{domain}.json"
+            entry = load_cookies_cached(cookie_file)
+            self._cookies[domain] = entry
+            return entry
+
+    def _start_watching(self) -> None:
+        mode, interval = "sweep", SWEEP_INTERVAL_SECONDS
+        if Observer is not None and self.cookie_dir.is_dir():
+            try:
+                observer = Observer()
+                observer.schedule(
+                    _CookieDirEventHandler(self), str(self.cookie_dir), recursive=False
+                )
+                observer.daemon = True
+                observer.start()
+            except OSError as exc:  # e.g. inotify watch/instance limits reached
+                logger.warning("cookie_dir_watch_failed", error=str(exc))
+            else:
+                self._observer = observer
+                mode, interval = "watchdog", RECONCILE_INTERVAL_SECONDS
+
+        thread = threading.Thread(
+            target=self._sweep_loop,
+            args=(interval,),
+            name="cookie-dir-sweep",
+            daemon=True,
+        )
+        thread.start()
+        logger.info("cookie_dir_watch_started", mode=mode, interval=interval)
+
+    def _sweep_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self._sweep()
+            except Exception:
+                logger.exception("cookie_dir_sweep_failed")
+
+    def _sweep(self) -> None:
+        """Reload cookie files whose mtime changed and forget deleted ones."""
+        try:
+            with os.scandir(self.cookie_dir) as it:
+                mtimes = {
+                    e.name.removesuffix(".json"): e.stat().st_mtime_ns
+                    for e in it
+                    if e.name.endswith(".json") and e.is_file()
+                }
+        except FileNotFoundError:
+            mtimes = {}
+
+        with self._lock:
+            for domain in self._mtimes.keys() - mtimes.keys():
+                self._cookies.pop(domain, None)
+            for domain, mtime_ns in mtimes.items():
+                if self._mtimes.get(domain) != mtime_ns:
+                    self.reload_domain(domain)
+            self._mtimes = mtimes
+
     def request(self, flow: http.HTTPFlow) -> None:
         """Intercept request and inject cookies or return 502."""
+        if self.skip_when_present and "Cookie" in flow.request.headers:
+            return
+
         host = flow.request.pretty_host
         log = logger.bind(host=host)
 
@@ -51,29 +197,39 @@ class CookieInjectorAddon:
             log.warning("cannot_extract_domain_skipping")
             return
 
-        cookie_file = self.cookie_dir / f"{domain}.json"
         log = log.bind(domain=domain)
 
-        if not cookie_file.exists():
-            log.warning("cookie_file_missing")
+        now = time.time()
+        entry = self._cookies.get(domain)
+        if entry is None and now < self._missing.get(domain, 0.0):
+            log.debug("cookie_file_missing_cached")
             self._return_502(flow, "missing", domain)
             return
 
         try:
-            cookies, metadata = load_cookies(cookie_file)
-        except (json.JSONDecodeError, ValueError, FileNotFoundError) as exc:
+            if entry is None or now >= entry[2]:
+                entry = self._load_domain(domain)
+        except FileNotFoundError:
+            log.warning("cookie_file_missing")
+            if len(self._missing) >= _MISSING_CACHE_MAX_ENTRIES:
+                self._missing.clear()
+            self._missing[domain] = now + MISSING_TTL_SECONDS
+            self._return_502(flow, "missing", domain)
+            return
+        except Exception as exc:
             log.error("cookie_load_error", error=str(exc))
             self._return_502(flow, "error", domain)
             return
 
-        status, valid_cookies = get_cookie_status(cookies)
+        valid_cookies, header, valid_until = entry
+        status = get_expiry_status(valid_until, now)
 
         if status == "expired":
             log.warning("all_cookies_expired")
             self._return_502(flow, "expired", domain)
             return
 
-        flow.request.headers["Cookie"] = format_cookies(valid_cookies)
+        flow.request.headers["Cookie"] = header
         self._flow_status[flow.id] = status
         log.info("cookies_injected", status=status, count=len(valid_cookies))
 
@@ -90,20 +246,32 @@ class CookieInjectorAddon:
         domain: str,
     ) -> None:
         """Short-circuit flow with 502 Bad Gateway JSON response."""
-        error_body = {
-            "error": "cookie_injector_no_valid_cookies",
-            "domain": domain,
-            "message": f"No valid authentication cookies available. Reason: {reason}",
-            "status": reason,
-        }
-        flow.response = http.Response.make(
-            502,
-            json.dumps(error_body).encode(),
-            {
+        key = (domain, reason)
+        body = _ERROR_BODY_CACHE.get(key)
+        if body is None:
+            body = orjson.dumps(
+                {
+                    "error": "cookie_injector_no_valid_cookies",
+                    "domain": domain,
+                    "message": (
+                        f"No valid authentication cookies available. Reason: {reason}"
+                    ),
+                    "status": reason,
+                }
+            )
+            _ERROR_BODY_CACHE[key] = body
+            if len(_ERROR_BODY_CACHE) > _ERROR_BODY_CACHE_MAX_ENTRIES:
+                _ERROR_BODY_CACHE.popitem(last=False)
+        else:
+            _ERROR_BODY_CACHE.move_to_end(key)
+
+        headers = _ERROR_HEADERS.get(reason)
+        if headers is None:
+            headers = _ERROR_HEADERS[reason] = {
                 "Content-Type": "application/json",
                 "X-Cookie-Injector-Status": reason,
-            },
-        )
+            }
+        flow.response = http.Response.make(502, body, headers)
         logger.warning("returned_502", domain=domain, reason=reason)
 
 
@@ -4,15 +4,49 @@ No mitmproxy dependency — independently testable.
 """
 from __future__ import annotations
 
-import json
+import functools
+import math
+import os
+import threading
 import time
+from array import array
+from collections.abc import Callable
+from concurrent.futures import Future
 from pathlib import Path
+from typing import NamedTuple, TypeVar
 
+import orjson
 import structlog
 import tldextract
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Offline extractor pinned to tldextract's bundled public suffix snapshot.
+_EXTRACTOR = tldextract.TLDExtract(suffix_list_urls=())
+
+EXPIRING_THRESHOLD_SECONDS = 24 * 3600
+
+
+class _HeaderCacheEntry(NamedTuple):
+    """Per-file injection state for load_cookies_cached()."""
+
+    mtime_ns: int
+    size: int
+    cookies: list[dict]
+    expires: array  # mirrors cookies as a flat float array
+    valid_until: float
+    valid: list[dict]
+    header: str
+
+
+_HEADER_CACHE: dict[Path, _HeaderCacheEntry] = {}
+
+# Reads currently in progress, so concurrent misses for one file share a read.
+_INFLIGHT: dict[Path, Future] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
 
 def get_canonical_domain(host: str) -> str:
     """Extract the canonical registered domain from a hostname.
@@ -26,9 +60,18 @@ def get_canonical_domain(host: str) -> str:
     Raises:
         ValueError: If the host cannot be parsed.
     """
-    extracted = tldextract.extract(host)
-    if not extracted.domain or not extracted.suffix:
+    domain = _extract_domain(host)
+    if domain is None:
         raise ValueError(f"Cannot extract canonical domain from host: {host!r}")
+    return domain
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_domain(host: str) -> str | None:
+    """Memoized registered-domain lookup; None marks an unparseable host."""
+    extracted = _EXTRACTOR(host)
+    if not extracted.domain or not extracted.suffix:
+        return None
     return f"{extracted.domain}.{extracted.suffix}"
 
 
@@ -44,17 +87,104 @@ def load_cookies(path: Path) -> tuple[list[dict], dict]:
     Raises:
         FileNotFoundError: If path does not exist.
         ValueError: If missing 'cookies' key.
-        json.JSONDecodeError: If invalid JSON.
+        orjson.JSONDecodeError: If invalid JSON.
     """
     if not path.exists():
         raise FileNotFoundError(f"Cookie file not found: {path}")
-    with path.open() as f:
-        data = json.load(f)
+    data = orjson.loads(path.read_bytes())
     if "cookies" not in data:
         raise ValueError(f"Invalid cookie file format (missing 'cookies' key): {path}")
     return data["cookies"], data.get("metadata", {})
 
 
+def load_cookies_cached(path: Path) -> tuple[list[dict], str, float]:
+    """Load currently valid cookies and their preformatted Cookie header.
+
+    The result is cached per file and reused until the file changes on disk
+    or the earliest-expiring cookie in it lapses, so repeated requests for the
+    same domain cost a single stat. When only a cookie lapsed, the valid set is
+    recomputed from the cached expiry array without re-reading the file.
+
+    Args:
+        path: Path to the .json cookie file.
+
+    Returns:
+        Tuple of (valid_cookies, header, valid_until). valid_until is the
+        earliest expiry among valid_cookies, or inf if all cookies expired.
+
+    Raises:
+        FileNotFoundError: If path does not exist.
+        ValueError: If missing 'cookies' key.
+        orjson.JSONDecodeError: If invalid JSON.
+    """
+    st = path.stat()
+    now = time.time()
+    cached = _HEADER_CACHE.get(path)
+    if (
+        cached is not None
+        and cached.mtime_ns == st.st_mtime_ns
+        and cached.size == st.st_size
+    ):
+        if now < cached.valid_until:
+            return cached.valid, cached.header, cached.valid_until
+        cookies, expires = cached.cookies, cached.expires
+    else:
+        # Key the cache on the fstat of the bytes actually read: a coalesced
+        # caller's own stat may be newer than the read it shared.
+        st, cookies = _single_flight(path, _read_cookies, path)
+        expires = array("d", [c.get("expires", -1) for c in cookies])
+
+    valid = [c for c, e in zip(cookies, expires) if e > now]
+    valid_until = min((e for e in expires if e > now), default=math.inf)
+    header = format_cookies(valid)
+    _HEADER_CACHE[path] = _HeaderCacheEntry(
+        st.st_mtime_ns, st.st_size, cookies, expires, valid_until, valid, header
+    )
+    return valid, header, valid_until
+
+
+def _read_cookies(path: Path) -> tuple[os.stat_result, list[dict]]:
+    """Read a cookie file, returning its cookies with the fstat of that read."""
+    with path.open("rb") as f:
+        st = os.fstat(f.fileno())
+        data = orjson.loads(f.read())
+    if "cookies" not in data:
+        raise ValueError(f"Invalid cookie file format (missing 'cookies' key): {path}")
+    return st, data["cookies"]
+
+
+def _single_flight(key: Path, fn: Callable[..., T], *args: object) -> T:
+    """Run fn(*args) once per key at a time; concurrent callers share its result.
+
+    Args:
+        key: Identity of the work, e.g. the file being read.
+        fn: Function to run.
+        *args: Arguments for fn.
+
+    Returns:
+        The leader's result. Its exception, if any, is raised in every caller.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        leader = future is None
+        if leader:
+            future = _INFLIGHT[key] = Future()
+    if not leader:
+        return future.result()
+
+    try:
+        result = fn(*args)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
 def format_cookies(cookies: list[dict]) -> str:
     """Format cookie dicts into a Cookie header value.
 
@@ -67,22 +197,20 @@ def format_cookies(cookies: list[dict]) -> str:
     return "; ".join(f"{c['name']}={c['value']}" for c in cookies)
 
 
-def get_cookie_status(cookies: list[dict]) -> tuple[str, list[dict]]:
-    """Determine hybrid-failure status of cookies (ADR-0001).
+def get_expiry_status(min_expiry: float, now: float | None = None) -> str:
+    """Determine hybrid-failure status from the earliest valid expiry (ADR-0001).
 
     Args:
-        cookies: Raw cookie list from JSON store.
+        min_expiry: Earliest expiry among valid cookies, inf if there are none.
+        now: Current Unix time. Defaults to time.time().
 
     Returns:
-        Tuple of (status, valid_cookies) where status is one of
-        "expired", "expiring", or "ok".
+        One of "expired", "expiring", or "ok".
     """
-    now = time.time()
-    valid = [c for c in cookies if c.get("expires", -1) > now]
-    if not valid:
-        return "expired", []
-    min_expiry = min(c["expires"] for c in valid)
-    time_remaining = min_expiry - now
-    if time_remaining < 24 * 3600:
-        return "expiring", valid
-    return "ok", valid
+    if now is None:
+        now = time.time()
+    if min_expiry == math.inf or min_expiry <= now:
+        return "expired"
+    if min_expiry - now < EXPIRING_THRESHOLD_SECONDS:
+        return "expiring"
+    return "ok"
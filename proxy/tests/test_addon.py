@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -11,8 +12,9 @@ import pytest
 from proxy.cookie_store import (
     format_cookies,
     get_canonical_domain,
-    get_cookie_status,
+    get_expiry_status,
     load_cookies,
+    load_cookies_cached,
 )
 
 
@@ -42,6 +44,11 @@ def test_canonical_domain_invalid_raises():
     with pytest.raises(ValueError):
         get_canonical_domain("localhost")
 
+def test_canonical_domain_invalid_raises_when_cached():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            get_canonical_domain("intranet")
+
 
 # --- load_cookies ---
 
@@ -69,6 +76,107 @@ def test_load_cookies_missing_key(tmp_path):
         load_cookies(tmp_path / "bad.json")
 
 
+# --- load_cookies_cached ---
+
+def test_load_cookies_cached_builds_header(tmp_path):
+    _write_cookie_file(tmp_path, "nrc.nl", [
+        {"name": "a", "value": "1", "expires": time.time() + 3600},
+        {"name": "old", "value": "x", "expires": time.time() - 3600},
+        {"name": "b", "value": "2", "expires": time.time() + 7200},
+    ])
+    valid, header, _ = load_cookies_cached(tmp_path / "nrc.nl.json")
+    assert [c["name"] for c in valid] == ["a", "b"]
+    assert header == "a=1; b=2"
+
+def test_load_cookies_cached_reloads_on_change(tmp_path):
+    path = tmp_path / "nrc.nl.json"
+    _write_cookie_file(
+        tmp_path, "nrc.nl", [{"name": "a", "value": "1", "expires": 9999999999}]
+    )
+    assert load_cookies_cached(path)[1] == "a=1"
+    _write_cookie_file(
+        tmp_path, "nrc.nl", [{"name": "bb", "value": "22", "expires": 9999999999}]
+    )
+    assert load_cookies_cached(path)[1] == "bb=22"
+
+def test_load_cookies_cached_drops_lapsed_cookie(tmp_path, monkeypatch):
+    now = time.time()
+    _write_cookie_file(tmp_path, "nrc.nl", [
+        {"name": "short", "value": "1", "expires": now + 60},
+        {"name": "long", "value": "2", "expires": now + 7200},
+    ])
+    path = tmp_path / "nrc.nl.json"
+    assert load_cookies_cached(path)[1] == "short=1; long=2"
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    valid, header, valid_until = load_cookies_cached(path)
+    assert header == "long=2"
+    assert valid_until == pytest.approx(now + 7200)
+
+def test_load_cookies_cached_coalesces_concurrent_reads(tmp_path, monkeypatch):
+    from proxy import cookie_store
+
+    _write_cookie_file(
+        tmp_path, "nrc.nl", [{"name": "a", "value": "1", "expires": 9999999999}]
+    )
+    reads = []
+    real_read = cookie_store._read_cookies
+
+    def slow_read(path):
+        reads.append(path)
+        time.sleep(0.2)
+        return real_read(path)
+
+    monkeypatch.setattr(cookie_store, "_read_cookies", slow_read)
+    headers = []
+    threads = [
+        threading.Thread(
+            target=lambda: headers.append(
+                load_cookies_cached(tmp_path / "nrc.nl.json")[1]
+            )
+        )
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(reads) == 1
+    assert headers == ["a=1"] * 5
+
+def test_load_cookies_cached_keyed_on_shared_read(tmp_path, monkeypatch):
+    from proxy import cookie_store
+
+    path = tmp_path / "nrc.nl.json"
+    _write_cookie_file(
+        tmp_path, "nrc.nl", [{"name": "a", "value": "1", "expires": 9999999999}]
+    )
+    real_read = cookie_store._read_cookies
+
+    def slow_read(path):
+        result = real_read(path)
+        time.sleep(0.3)
+        return result
+
+    monkeypatch.setattr(cookie_store, "_read_cookies", slow_read)
+    leader = threading.Thread(target=load_cookies_cached, args=(path,))
+    leader.start()
+    time.sleep(0.1)
+    # Replaced while the leader is reading; this caller joins the old read.
+    _write_cookie_file(
+        tmp_path, "nrc.nl", [{"name": "bb", "value": "22", "expires": 9999999999}]
+    )
+    follower = threading.Thread(target=load_cookies_cached, args=(path,))
+    follower.start()
+    leader.join()
+    follower.join()
+
+    assert load_cookies_cached(path)[1] == "bb=22"
+
+def test_load_cookies_cached_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_cookies_cached(tmp_path / "missing.json")
+
+
 # --- format_cookies ---
 
 def test_format_single():
@@ -82,47 +190,62 @@ def test_format_empty():
     assert format_cookies([]) == ""
 
 
-# --- get_cookie_status (ADR-0001) ---
+# --- hybrid-failure status (ADR-0001) ---
+
+def _status(tmp_path, cookies):
+    _write_cookie_file(tmp_path, "nrc.nl", cookies)
+    valid, _, valid_until = load_cookies_cached(tmp_path / "nrc.nl.json")
+    return get_expiry_status(valid_until), valid
 
-def test_status_expired():
-    status, valid = get_cookie_status([{"name": "s", "expires": time.time() - 3600}])
+def test_status_expired(tmp_path):
+    status, valid = _status(
+        tmp_path, [{"name": "s", "value": "v", "expires": time.time() - 3600}]
+    )
     assert status == "expired"
     assert valid == []
 
-def test_status_expiring():
-    status, valid = get_cookie_status(
-        [{"name": "s", "expires": time.time() + 12 * 3600}]
+def test_status_expiring(tmp_path):
+    status, valid = _status(
+        tmp_path, [{"name": "s", "value": "v", "expires": time.time() + 12 * 3600}]
     )
     assert status == "expiring"
     assert len(valid) == 1
 
-def test_status_ok():
-    status, valid = get_cookie_status(
-        [{"name": "s", "expires": time.time() + 48 * 3600}]
+def test_status_ok(tmp_path):
+    status, valid = _status(
+        tmp_path, [{"name": "s", "value": "v", "expires": time.time() + 48 * 3600}]
     )
     assert status == "ok"
     assert len(valid) == 1
 
-def test_status_mixed():
+def test_status_mixed(tmp_path):
     cookies = [
-        {"name": "expired", "expires": time.time() - 3600},
-        {"name": "valid", "expires": time.time() + 48 * 3600},
+        {"name": "expired", "value": "v", "expires": time.time() - 3600},
+        {"name": "valid", "value": "v", "expires": time.time() + 48 * 3600},
     ]
-    status, valid = get_cookie_status(cookies)
+    status, valid = _status(tmp_path, cookies)
     assert status == "ok"
     assert len(valid) == 1
     assert valid[0]["name"] == "valid"
 
-def test_status_uses_earliest_expiry():
+def test_status_uses_earliest_expiry(tmp_path):
     cookies = [
-        {"name": "a", "expires": time.time() + 12 * 3600},
-        {"name": "b", "expires": time.time() + 48 * 3600},
+        {"name": "a", "value": "v", "expires": time.time() + 12 * 3600},
+        {"name": "b", "value": "v", "expires": time.time() + 48 * 3600},
     ]
-    status, valid = get_cookie_status(cookies)
+    status, valid = _status(tmp_path, cookies)
     assert status == "expiring"
     assert len(valid) == 2
 
 
+def test_expiry_status_thresholds():
+    now = 1_000_000.0
+    assert get_expiry_status(float("inf"), now) == "expired"
+    assert get_expiry_status(now - 1, now) == "expired"
+    assert get_expiry_status(now + 12 * 3600, now) == "expiring"
+    assert get_expiry_status(now + 48 * 3600, now) == "ok"
+
+
 # --- CookieInjectorAddon integration tests ---
 
 @pytest.fixture(autouse=True, scope="session")
@@ -150,7 +273,8 @@ def addon(tmp_path, monkeypatch):
 
     a = CookieInjectorAddon()
     a.cookie_dir = tmp_path
-    return a
+    yield a
+    a.done()
 
 
 class TestAddonRequest:
@@ -218,3 +342,120 @@ class TestAddonRequest:
         flow = _make_flow("localhost")
         addon.request(flow)
         assert flow.response is None
+
+    def test_reload_picks_up_rewritten_file(self, addon, tmp_path):
+        _write_cookie_file(
+            tmp_path, "nrc.nl", [{"name": "s", "value": "v", "expires": 9999999999}]
+        )
+        addon.request(_make_flow("www.nrc.nl"))
+        _write_cookie_file(
+            tmp_path, "nrc.nl", [{"name": "t", "value": "w2", "expires": 9999999999}]
+        )
+        addon.reload_domain("nrc.nl")
+        flow = _make_flow("www.nrc.nl")
+        addon.request(flow)
+        assert flow.request.headers["Cookie"] == "t=w2"
+
+    def test_deleted_file_event_returns_502(self, addon, tmp_path):
+        from types import SimpleNamespace
+
+        from proxy.addon import _CookieDirEventHandler
+
+        _write_cookie_file(
+            tmp_path, "nrc.nl", [{"name": "s", "value": "v", "expires": 9999999999}]
+        )
+        addon.request(_make_flow("www.nrc.nl"))
+        (tmp_path / "nrc.nl.json").unlink()
+        _CookieDirEventHandler(addon).dispatch(SimpleNamespace(
+            event_type="deleted",
+            is_directory=False,
+            src_path=str(tmp_path / "nrc.nl.json"),
+            dest_path="",
+        ))
+        flow = _make_flow("www.nrc.nl")
+        addon.request(flow)
+        assert flow.response.status_code == 502
+        assert json.loads(flow.response.get_text())["status"] == "missing"
+
+    def test_unreadable_file_does_not_break_startup(self, tmp_path, monkeypatch):
+        import proxy.addon
+
+        def denied(path):
+            raise PermissionError(f"Permission denied: {path}")
+
+        _write_cookie_file(
+            tmp_path, "nrc.nl", [{"name": "s", "value": "v", "expires": 9999999999}]
+        )
+        monkeypatch.setenv("COOKIE_DIR", str(tmp_path))
+        monkeypatch.setattr(proxy.addon, "load_cookies_cached", denied)
+        a = proxy.addon.CookieInjectorAddon()
+        try:
+            flow = _make_flow("www.nrc.nl")
+            a.request(flow)
+            assert flow.response.status_code == 502
+            assert json.loads(flow.response.get_text())["status"] == "error"
+        finally:
+            a.done()
+
+    def test_watch_start_failure_falls_back_to_sweep(self, tmp_path, monkeypatch):
+        import proxy.addon
+
+        class FailingObserver:
+            def schedule(self, *args, **kwargs):
+                pass
+
+            def start(self):
+                raise OSError(24, "inotify instance limit reached")
+
+        monkeypatch.setenv("COOKIE_DIR", str(tmp_path))
+        monkeypatch.setattr(proxy.addon, "Observer", FailingObserver)
+        monkeypatch.setattr(proxy.addon, "SWEEP_INTERVAL_SECONDS", 0.05)
+        a = proxy.addon.CookieInjectorAddon()
+        try:
+            assert a._observer is None
+            _write_cookie_file(
+                tmp_path, "nrc.nl", [{"name": "s", "value": "v", "expires": 9999999999}]
+            )
+            deadline = time.monotonic() + 2
+            while "nrc.nl" not in a._cookies and time.monotonic() < deadline:
+                time.sleep(0.02)
+            flow = _make_flow("www.nrc.nl")
+            a.request(flow)
+            assert flow.response is None
+            assert flow.request.headers["Cookie"] == "s=v"
+        finally:
+            a.done()
+
+    def test_null_expiry_reload_returns_502(self, addon, tmp_path):
+        _write_cookie_file(
+            tmp_path, "nrc.nl", [{"name": "s", "value": "v", "expires": None}]
+        )
+        addon.reload_domain("nrc.nl")
+        flow = _make_flow("www.nrc.nl")
+        addon.request(flow)
+        assert flow.response.status_code == 502
+        assert json.loads(flow.response.get_text())["status"] == "error"
+
+    def test_existing_cookie_kept_when_skip_enabled(self, addon):
+        addon.skip_when_present = True
+        flow = _make_flow("www.nrc.nl")
+        flow.request.headers["Cookie"] = "own=1"
+        addon.request(flow)
+        assert flow.response is None
+        assert flow.request.headers["Cookie"] == "own=1"
+
+    def test_missing_cached_until_file_appears(self, addon, tmp_path):
+        addon.done()  # deliver reloads by hand instead of from the watcher
+        addon.request(_make_flow("www.nrc.nl"))
+        _write_cookie_file(
+            tmp_path, "nrc.nl", [{"name": "s", "value": "v", "expires": 9999999999}]
+        )
+        flow = _make_flow("www.nrc.nl")
+        addon.request(flow)
+        assert flow.response.status_code == 502
+
+        addon.reload_domain("nrc.nl")
+        flow = _make_flow("www.nrc.nl")
+        addon.request(flow)
+        assert flow.response is None
+        assert flow.request.headers["Cookie"] == "s=v"
@@ -8,6 +8,31 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to ntfy and healthchecks.io alive
+    between alerts instead of paying a TCP+TLS handshake per call.
+    """
+    global _CLIENT
+    if _CLIENT is None or _CLIENT.is_closed:
+        _CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+        )
+    return _CLIENT
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client. Call once on service shutdown."""
+    global _CLIENT
+    if _CLIENT is not None:
+        await _CLIENT.aclose()
+        _CLIENT = None
+
 
 async def send_ntfy_alert(domain: str, error: str, ntfy_url: str | None = None) -> None:
     """Send push notification via ntfy on refresh failure.
@@ -22,17 +47,16 @@ async def send_ntfy_alert(domain: str, error: str, ntfy_url: str | None = None)
         return
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.post(
-                url,
-                content=f"Cookie refresh FAILED for {domain}: {error}",
-                headers={
-                    "Title": f"cookie-injector: {domain} failed",
-                    "Priority": "high",
-                    "Tags": "warning,cookie-injector",
-                },
-            )
-            response.raise_for_status()
+        response = await get_client().post(
+            url,
+            content=f"Cookie refresh FAILED for {domain}: {error}",
+            headers={
+                "Title": f"cookie-injector: {domain} failed",
+                "Priority": "high",
+                "Tags": "warning,cookie-injector",
+            },
+        )
+        response.raise_for_status()
         logger.info("ntfy_alert_sent", domain=domain)
     except Exception as exc:
         logger.error("ntfy_alert_failed", domain=domain, error=str(exc))
@@ -56,9 +80,8 @@ async def ping_healthcheck(
 
     ping_url = url if success else f"{url}/fail"
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(ping_url)
-            response.raise_for_status()
+        response = await get_client().get(ping_url)
+        response.raise_for_status()
         logger.info("healthcheck_pinged", domain=domain, success=success)
     except Exception as exc:
         logger.error("healthcheck_ping_failed", domain=domain, error=str(exc))
@@ -2,19 +2,49 @@
 from __future__ import annotations
 
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Literal
 
 import structlog
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
 logger = structlog.get_logger(__name__)
 
+_INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_interval(value: str) -> int:
+    """Convert a duration like "45s", "30m", "12h" or "1d" to seconds.
+
+    Args:
+        value: Positive integer followed by a unit (s, m, h, d).
+
+    Returns:
+        Duration in seconds.
+
+    Raises:
+        ValueError: If value is not a valid duration.
+    """
+    number, unit = value[:-1], value[-1:].lower()
+    if unit not in _INTERVAL_UNITS or not number.isdigit() or int(number) == 0:
+        raise ValueError(
+            f"Invalid interval {value!r}; expected e.g. '45s', '30m', '12h', '1d'"
+        )
+    return int(number) * _INTERVAL_UNITS[unit]
+
 
 class AuthConfig(BaseModel):
     """Authentication configuration for a single site."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     type: Literal["credentials", "oauth"]
     username_env: str | None = None
     password_env: str | None = None
@@ -23,15 +53,47 @@ class AuthConfig(BaseModel):
 class SiteConfig(BaseModel):
     """Configuration for a single paywalled site."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     domain: str
     login_url: str
     auth: AuthConfig
     refresh_interval: str = "12h"
 
+    @cached_property
+    def refresh_interval_seconds(self) -> int:
+        """refresh_interval in seconds, parsed once per model.
+
+        Raises:
+            ValueError: If refresh_interval is not a valid duration.
+        """
+        return parse_interval(self.refresh_interval)
+
+    @cached_property
+    def script_module_name(self) -> str:
+        """Login script module, e.g. nrc.nl -> refresh.scripts.nrc_nl."""
+        return "refresh.scripts." + self.domain.replace(".", "_")
+
+    def missing_credentials(self) -> list[str]:
+        """Return configured credential env vars that are unset or empty.
+
+        Only applies to "credentials" auth; env vars left unconfigured fall
+        back to the login script's defaults and are not checked here.
+        """
+        if self.auth.type != "credentials":
+            return []
+        return [
+            name
+            for name in (self.auth.username_env, self.auth.password_env)
+            if name and not os.getenv(name)
+        ]
+
 
 class Config(BaseModel):
     """Top-level refresh service configuration."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     sites: list[SiteConfig]
     cookie_dir: str = Field(default_factory=lambda: os.getenv("COOKIE_DIR", "/cookies"))
     ntfy_url: str | None = None
@@ -60,9 +122,9 @@ def load_config(path: str | None = None) -> Config:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with config_path.open() as f:
-        raw = yaml.safe_load(f)
+        raw = yaml.load(f, Loader=_SafeLoader)
 
-    config = Config(**(raw or {}))
+    config = Config.model_validate(raw or {})
     logger.info(
         "config_loaded",
         path=str(config_path),
@@ -1,20 +1,25 @@
 """Atomic cookie persistence with ADR-0002 session cookie workaround."""
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import time
-from datetime import UTC, datetime
 from pathlib import Path
 
 import structlog
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
 logger = structlog.get_logger(__name__)
 
 SESSION_COOKIE_TTL_SECONDS = 30 * 24 * 3600  # 30 days
 
 
-def apply_session_cookie_workaround(cookies: list[dict]) -> list[dict]:
+def apply_session_cookie_workaround(cookies: list[dict]) -> tuple[list[dict], int]:
     """Set explicit expiry on session cookies (ADR-0002).
 
     Playwright does not persist session cookies (expires=-1) across browser
@@ -24,24 +29,56 @@ def apply_session_cookie_workaround(cookies: list[dict]) -> list[dict]:
         cookies: Cookie dicts from Playwright context.cookies().
 
     Returns:
-        New list with session cookies given 30-day expiry. Input not mutated.
+        Tuple of (cookies, converted_count). Session cookies are replaced by
+        copies with a 30-day expiry; other cookies are passed through as-is.
+        When there are no session cookies the input list itself is returned.
+        Input not mutated.
     """
-    now = int(time.time())
+    if not any(c.get("expires", -1) == -1 for c in cookies):
+        return cookies, 0
+
+    ttl_expiry = int(time.time()) + SESSION_COOKIE_TTL_SECONDS
     processed: list[dict] = []
+    converted = 0
 
     for cookie in cookies:
-        c = cookie.copy()
-        if c.get("expires", -1) == -1:
-            c["expires"] = now + SESSION_COOKIE_TTL_SECONDS
-            logger.info(
-                "session_cookie_workaround_applied",
-                cookie_name=c.get("name"),
-                domain=c.get("domain"),
-                expires=c["expires"],
-            )
-        processed.append(c)
+        if cookie.get("expires", -1) == -1:
+            processed.append({**cookie, "expires": ttl_expiry})
+            converted += 1
+        else:
+            processed.append(cookie)
+
+    logger.info("session_cookies_converted", count=converted, expires=ttl_expiry)
+    return processed, converted
+
+
+def utc_z(ts: float) -> str:
+    """Format a Unix timestamp as ISO 8601 UTC with second precision.
+
+    Args:
+        ts: Unix timestamp.
+
+    Returns:
+        e.g. "2026-02-21T10:30:00Z".
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts))
 
-    return processed
+
+def _dumps(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode()
+
+
+def _loads(raw: bytes) -> dict:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _read_bytes(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
 
 
 def save_cookies_with_metadata(
@@ -50,10 +87,13 @@ def save_cookies_with_metadata(
     cookie_dir: str | Path,
     refresh_source: str = "scheduled",
     next_refresh_at: str | None = None,
-) -> None:
+    human_readable: bool = False,
+) -> dict:
     """Atomically save cookies and metadata in ADR-0004 format.
 
-    Applies session cookie workaround, writes to .json.tmp, then renames.
+    Applies session cookie workaround, writes to a freshly created .json.tmp,
+    fsyncs it, verifies the bytes on disk by SHA-256, then renames it over
+    the target and fsyncs the directory (POSIX) so the rename is durable.
 
     Args:
         domain: Canonical domain, e.g. "nrc.nl".
@@ -61,35 +101,72 @@ def save_cookies_with_metadata(
         cookie_dir: Directory for {domain}.json files.
         refresh_source: One of "scheduled", "manual", "startup".
         next_refresh_at: ISO 8601 next refresh time, or None.
-    """
-    cookie_dir = Path(cookie_dir)
-    cookie_file = cookie_dir / f"{domain}.json"
-    tmp_file = cookie_dir / f"{domain}.json.tmp"
+        human_readable: Also store refreshed_at_iso, an ISO 8601 rendering of
+            the refreshed_at epoch.
+
+    Returns:
+        The metadata written alongside the cookies.
 
-    processed_cookies = apply_session_cookie_workaround(cookies)
+    Raises:
+        OSError: If the temp file cannot be written or does not read back
+            identically. The existing cookie file is left untouched.
+    """
+    cookie_dir = os.fspath(cookie_dir)
+    cookie_file = os.path.join(cookie_dir, f"{domain}.json")
+    tmp_file = cookie_file + ".tmp"
 
-    session_cookie_count = sum(1 for c in cookies if c.get("expires", -1) == -1)
+    processed_cookies, session_cookie_count = apply_session_cookie_workaround(cookies)
 
+    now = time.time()
+    refreshed_at = int(now)
     metadata: dict = {
-        "refreshed_at": datetime.now(tz=UTC).isoformat().replace("+00:00", "Z"),
+        "refreshed_at": refreshed_at,
         "refresh_source": refresh_source,
         "site_config": domain,
         "cookies_count": len(processed_cookies),
         "session_cookie_workaround": session_cookie_count > 0,
         "session_cookies_converted": session_cookie_count,
+        # Earliest expiry among cookies still valid at save time, 0 if none.
+        "min_expires": min(
+            (c["expires"] for c in processed_cookies if c.get("expires", -1) > now),
+            default=0,
+        ),
     }
+    if human_readable:
+        metadata["refreshed_at_iso"] = utc_z(refreshed_at)
     if next_refresh_at is not None:
         metadata["next_refresh"] = next_refresh_at
 
     data = {"cookies": processed_cookies, "metadata": metadata}
 
-    with tmp_file.open("w") as f:
-        json.dump(data, f, indent=2)
+    payload = _dumps(data)
+    try:
+        os.unlink(tmp_file)  # stale leftover from an interrupted save
+    except FileNotFoundError:
+        pass
+    # 0644 (subject to umask): the proxy reads these as an unprivileged user.
+    fd = os.open(tmp_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    with os.fdopen(fd, "wb") as f:
+        f.write(payload)
         f.flush()
         os.fsync(f.fileno())
 
-    tmp_file.rename(cookie_file)
+    digest = hashlib.sha256(payload).digest()
+    if hashlib.sha256(_read_bytes(tmp_file)).digest() != digest:
+        os.unlink(tmp_file)
+        logger.error("cookie_write_corrupted", domain=domain)
+        raise OSError(f"Cookie file write verification failed: {tmp_file}")
+
+    os.replace(tmp_file, cookie_file)
+    if os.name == "posix":
+        # Persist the rename itself, not just the file contents.
+        dir_fd = os.open(cookie_dir, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
     logger.info("cookies_saved", domain=domain, cookies_count=len(processed_cookies))
+    return metadata
 
 
 def load_cookies(path: Path) -> tuple[list[dict], dict]:
@@ -103,8 +180,7 @@ def load_cookies(path: Path) -> tuple[list[dict], dict]:
     """
     if not path.exists():
         raise FileNotFoundError(f"Cookie file not found: {path}")
-    with path.open() as f:
-        data = json.load(f)
+    data = _loads(path.read_bytes())
     if "cookies" not in data:
         raise ValueError(f"Invalid cookie file format: {path}")
     return data["cookies"], data.get("metadata", {})
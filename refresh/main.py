@@ -4,16 +4,41 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+from pathlib import Path
 
 import structlog
+from playwright.async_api import async_playwright
 
+from refresh import alerting
 from refresh.config import load_config
-from refresh.scheduler import run_scheduled_refresh
+from refresh.refresh import SharedBrowser, load_login_script
+from refresh.scheduler import calculate_next_refresh, run_scheduled_refresh
+
+try:
+    import orjson
+except ImportError:  # fall back to structlog's stdlib json serializer
+    orjson = None
+
+
+def _dumps(obj: object, **kw: object) -> str:
+    """structlog JSON serializer backed by orjson."""
+    return orjson.dumps(obj, default=kw.get("default")).decode()
+
 
 structlog.configure(
+    processors=[
+        structlog.contextvars.merge_contextvars,
+        structlog.processors.add_log_level,
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.JSONRenderer(
+            **({"serializer": _dumps} if orjson is not None else {})
+        ),
+    ],
     wrapper_class=structlog.make_filtering_bound_logger(
         getattr(logging, os.getenv("LOG_LEVEL", "INFO"), logging.INFO)
-    )
+    ),
 )
 
 logger = structlog.get_logger(__name__)
@@ -24,26 +49,56 @@ MAX_CONCURRENT_BROWSERS = 3
 async def main() -> None:
     """Load config and start one refresh scheduler per site."""
     config = load_config()
+    for site in config.sites:
+        load_login_script(site)
+        missing = site.missing_credentials()
+        if missing:
+            logger.error("missing_credentials", domain=site.domain, env_vars=missing)
+            raise ValueError(
+                f"Missing credentials for '{site.domain}': {', '.join(missing)}"
+            )
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_BROWSERS)
+    cookie_dir = Path(config.cookie_dir)
+    initial_intervals = await asyncio.gather(
+        *(
+            asyncio.to_thread(calculate_next_refresh, site.domain, cookie_dir)
+            for site in config.sites
+        )
+    )
     logger.info(
         "refresh_service_starting",
         sites=[s.domain for s in config.sites],
         max_concurrent=MAX_CONCURRENT_BROWSERS,
     )
 
-    tasks = [
-        asyncio.create_task(
-            run_scheduled_refresh(site, semaphore, config),
-            name=f"refresh-{site.domain}",
-        )
-        for site in config.sites
-    ]
-
     try:
-        await asyncio.gather(*tasks)
+        async with async_playwright() as p:
+            browser = SharedBrowser(p.chromium)
+            await browser.get()
+            try:
+                tasks = [
+                    asyncio.create_task(
+                        run_scheduled_refresh(
+                            site,
+                            semaphore,
+                            config,
+                            browser,
+                            precomputed_interval=interval,
+                        ),
+                        name=f"refresh-{site.domain}",
+                    )
+                    for site, interval in zip(
+                        config.sites, initial_intervals, strict=True
+                    )
+                ]
+                await asyncio.gather(*tasks)
+            finally:
+                await browser.close()
     except Exception:
         logger.exception("fatal_error")
         raise
+    finally:
+        await alerting.aclose()
 
 
 if __name__ == "__main__":
@@ -4,54 +4,127 @@ from __future__ import annotations
 import asyncio
 import importlib
 from pathlib import Path
+from types import ModuleType
 
 import structlog
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, BrowserType
 
 from refresh.config import SiteConfig
 from refresh.cookie_store import save_cookies_with_metadata
 
 logger = structlog.get_logger(__name__)
 
+# domain -> logger pre-bound with that domain
+_SITE_LOGGERS: dict[str, structlog.BoundLogger] = {}
+
 MAX_RETRIES = 3
 BASE_BACKOFF_SECONDS = 5
 LOGIN_FLOW_TIMEOUT = 120  # seconds
 
+# domain -> imported login script module
+_SCRIPT_CACHE: dict[str, ModuleType] = {}
+
+
+def _log_for(domain: str) -> structlog.BoundLogger:
+    """Return a logger bound to domain, created once per site."""
+    log = _SITE_LOGGERS.get(domain)
+    if log is None:
+        log = _SITE_LOGGERS[domain] = logger.bind(domain=domain)
+    return log
+
+
+def load_login_script(site: SiteConfig) -> ModuleType:
+    """Import the login script for a site, memoized per domain.
+
+    Args:
+        site: Site configuration.
+
+    Returns:
+        The refresh.scripts module providing login(page, site).
 
-def _script_module_name(domain: str) -> str:
-    """Convert domain to script module name (e.g. nrc.nl -> refresh.scripts.nrc_nl)."""
-    return "refresh.scripts." + domain.replace(".", "_")
+    Raises:
+        ModuleNotFoundError: If no script exists for the domain.
+    """
+    script_module = _SCRIPT_CACHE.get(site.domain)
+    if script_module is None:
+        module_name = site.script_module_name
+        try:
+            script_module = importlib.import_module(module_name)
+        except ModuleNotFoundError as exc:
+            raise ModuleNotFoundError(
+                f"No login script for '{site.domain}'. Expected: {module_name}"
+            ) from exc
+        _SCRIPT_CACHE[site.domain] = script_module
+    return script_module
+
+
+class SharedBrowser:
+    """Long-lived headless Chromium shared by all login flows.
+
+    Relaunched on demand if the browser process crashed or disconnected, so a
+    dead browser does not fail every later refresh.
+    """
+
+    def __init__(self, browser_type: BrowserType) -> None:
+        self._browser_type = browser_type
+        self._browser: Browser | None = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Browser:
+        """Return the connected browser, launching or relaunching it if needed."""
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._browser is not None:
+                    logger.warning("browser_disconnected_relaunching")
+                self._browser = await self._browser_type.launch(headless=True)
+            return self._browser
+
+    async def close(self) -> None:
+        """Close the browser if it is still running."""
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                await self._browser.close()
+            self._browser = None
 
 
 async def perform_refresh(
     site: SiteConfig,
     semaphore: asyncio.Semaphore,
     cookie_dir: str | Path,
-) -> None:
+    browser: SharedBrowser,
+) -> dict:
     """Execute login flow with retry. Never overwrites valid cookies on failure.
 
     Args:
         site: Site configuration.
-        semaphore: Concurrency limiter (max 3 browsers).
+        semaphore: Concurrency limiter (max 3 browser contexts).
         cookie_dir: Directory for {domain}.json files.
+        browser: Shared Chromium instance to open a login context in.
+
+    Returns:
+        Metadata of the saved cookie file.
+
+    Raises:
+        RuntimeError: If every attempt failed.
     """
-    log = logger.bind(domain=site.domain)
+    log = _log_for(site.domain)
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
             log.info("refresh_attempt_starting", attempt=attempt)
             cookies = await asyncio.wait_for(
-                _run_login_flow(site, semaphore),
+                _run_login_flow(site, semaphore, browser),
                 timeout=LOGIN_FLOW_TIMEOUT,
             )
-            save_cookies_with_metadata(
+            metadata = await asyncio.to_thread(
+                save_cookies_with_metadata,
                 domain=site.domain,
                 cookies=cookies,
                 cookie_dir=cookie_dir,
                 refresh_source="scheduled",
             )
             log.info("refresh_succeeded", attempt=attempt, cookies_count=len(cookies))
-            return
+            return metadata
         except Exception as exc:
             log.warning("refresh_attempt_failed", attempt=attempt, error=str(exc))
             if attempt < MAX_RETRIES:
@@ -65,32 +138,26 @@ async def perform_refresh(
 async def _run_login_flow(
     site: SiteConfig,
     semaphore: asyncio.Semaphore,
+    browser: SharedBrowser,
 ) -> list[dict]:
-    """Launch browser, run site script, return cookies.
+    """Open a fresh browser context, run site script, return cookies.
 
     Args:
         site: Site configuration.
         semaphore: Concurrency limiter.
+        browser: Shared Chromium, relaunched first if it has died.
 
     Returns:
         Cookie dicts from Playwright context.
     """
-    module_name = _script_module_name(site.domain)
-    try:
-        script_module = importlib.import_module(module_name)
-    except ModuleNotFoundError as exc:
-        raise ModuleNotFoundError(
-            f"No login script for '{site.domain}'. Expected: {module_name}"
-        ) from exc
+    script_module = load_login_script(site)
 
     async with semaphore:
-        logger.info("browser_acquired", domain=site.domain)
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            try:
-                context = await browser.new_context()
-                page = await context.new_page()
-                cookies = await script_module.login(page, site)
-                return cookies
-            finally:
-                await browser.close()
+        _log_for(site.domain).info("browser_acquired")
+        chromium = await browser.get()
+        context = await chromium.new_context()
+        try:
+            page = await context.new_page()
+            return await script_module.login(page, site)
+        finally:
+            await context.close()
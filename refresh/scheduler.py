@@ -2,16 +2,16 @@
 from __future__ import annotations
 
 import asyncio
+import math
 import time
-from datetime import UTC, datetime
 from pathlib import Path
 
 import structlog
 
 from refresh.alerting import ping_healthcheck, send_ntfy_alert
 from refresh.config import Config, SiteConfig
-from refresh.cookie_store import load_cookies
-from refresh.refresh import perform_refresh
+from refresh.cookie_store import load_cookies, utc_z
+from refresh.refresh import SharedBrowser, _log_for, perform_refresh
 
 logger = structlog.get_logger(__name__)
 
@@ -46,13 +46,25 @@ def calculate_next_refresh(domain: str, cookie_dir: Path) -> float:
         return 0.0
 
     now = time.time()
-    valid = [c for c in cookies if c.get("expires", -1) > now]
+    min_expiry = math.inf
+    for cookie in cookies:
+        expires = cookie.get("expires", -1)
+        if now < expires < min_expiry:
+            min_expiry = expires
 
-    if not valid:
+    return _interval_until(domain, min_expiry, now)
+
+
+def _interval_until(domain: str, min_expiry: float, now: float) -> float:
+    """Clamp 75% of the remaining cookie lifetime to [MIN_INTERVAL, MAX_INTERVAL].
+
+    Returns 0 if min_expiry is not in the future (inf or 0 means no valid
+    cookies).
+    """
+    if min_expiry == math.inf or min_expiry <= now:
         logger.info("all_expired_refresh_immediately", domain=domain)
         return 0.0
 
-    min_expiry = min(c["expires"] for c in valid)
     cookie_lifetime = min_expiry - now
     raw_interval = cookie_lifetime * 0.75
     interval = max(MIN_INTERVAL, min(MAX_INTERVAL, raw_interval))
@@ -66,10 +78,35 @@ def calculate_next_refresh(domain: str, cookie_dir: Path) -> float:
     return interval
 
 
+async def acalculate_next_refresh(domain: str, cookie_dir: Path) -> float:
+    """Run calculate_next_refresh in a worker thread, off the event loop."""
+    return await asyncio.to_thread(calculate_next_refresh, domain, cookie_dir)
+
+
+def calculate_next_refresh_from_metadata(
+    domain: str, metadata: dict, now: float
+) -> float:
+    """Calculate seconds until next refresh from saved metadata (ADR-0003).
+
+    Uses the precomputed "min_expires" instead of re-reading the cookie file.
+
+    Args:
+        domain: Canonical domain.
+        metadata: Metadata returned by save_cookies_with_metadata().
+        now: Current Unix time.
+
+    Returns:
+        Seconds to sleep before next refresh, 0 if all cookies expired.
+    """
+    return _interval_until(domain, metadata.get("min_expires", 0), now)
+
+
 async def run_scheduled_refresh(
     site: SiteConfig,
     semaphore: asyncio.Semaphore,
     config: Config,
+    browser: SharedBrowser,
+    precomputed_interval: float | None = None,
 ) -> None:
     """Adaptive refresh loop for a single site. Runs forever.
 
@@ -77,12 +114,17 @@ async def run_scheduled_refresh(
         site: Site configuration.
         semaphore: Shared concurrency limiter.
         config: Top-level config for cookie_dir and alerting URLs.
+        browser: Shared Chromium instance used for login flows.
+        precomputed_interval: Startup result of calculate_next_refresh, if
+            the caller already computed it.
     """
-    log = logger.bind(domain=site.domain)
+    log = _log_for(site.domain)
     cookie_dir = Path(config.cookie_dir)
 
     # Startup: skip immediate refresh if cookies are fresh
-    initial_interval = calculate_next_refresh(site.domain, cookie_dir)
+    initial_interval = precomputed_interval
+    if initial_interval is None:
+        initial_interval = await acalculate_next_refresh(site.domain, cookie_dir)
     if initial_interval >= STARTUP_SKIP_THRESHOLD:
         log.info(
             "startup_skip_cookies_fresh",
@@ -92,25 +134,28 @@ async def run_scheduled_refresh(
 
     while True:
         try:
-            await perform_refresh(site, semaphore, cookie_dir)
+            metadata = await perform_refresh(site, semaphore, cookie_dir, browser)
+            interval = calculate_next_refresh_from_metadata(
+                site.domain, metadata, time.time()
+            )
             await ping_healthcheck(
                 site.domain, success=True, healthcheck_url=config.healthcheck_url
             )
         except Exception as exc:
             log.error("scheduled_refresh_failed", error=str(exc))
-            await send_ntfy_alert(site.domain, str(exc), ntfy_url=config.ntfy_url)
-            await ping_healthcheck(
-                site.domain, success=False, healthcheck_url=config.healthcheck_url
+            await asyncio.gather(
+                send_ntfy_alert(site.domain, str(exc), ntfy_url=config.ntfy_url),
+                ping_healthcheck(
+                    site.domain, success=False, healthcheck_url=config.healthcheck_url
+                ),
+                return_exceptions=True,
             )
+            interval = await acalculate_next_refresh(site.domain, cookie_dir)
 
-        interval = calculate_next_refresh(site.domain, cookie_dir)
         if interval == 0:
             interval = MIN_INTERVAL
 
-        next_at = (
-            datetime.fromtimestamp(time.time() + interval, tz=UTC)
-            .strftime("%Y-%m-%dT%H:%M:%SZ")
-        )
+        next_at = utc_z(time.time() + interval)
         log.info(
             "next_refresh_scheduled", next_at=next_at, hours=round(interval / 3600, 2)
         )
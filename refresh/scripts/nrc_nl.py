@@ -10,6 +10,10 @@ from refresh.config import SiteConfig
 
 logger = structlog.get_logger(__name__)
 
+USERNAME_SELECTOR = 'input[name="username"]'
+PASSWORD_SELECTOR = 'input[name="password"]'
+SUBMIT_SELECTOR = 'button[type="submit"]'
+
 
 async def login(page: Page, config: SiteConfig) -> list[dict]:
     """Perform nrc.nl login and return cookies.
@@ -32,10 +36,13 @@ async def login(page: Page, config: SiteConfig) -> list[dict]:
 
     logger.info("login_starting", domain=config.domain, url=config.login_url)
 
-    await page.goto(config.login_url, wait_until="networkidle", timeout=30_000)
-    await page.fill('input[name="username"]', username)
-    await page.fill('input[name="password"]', password)
-    await page.click('button[type="submit"]')
+    # The form is usable long before ad/telemetry traffic goes idle.
+    await page.goto(config.login_url, wait_until="domcontentloaded", timeout=30_000)
+    username_input = page.locator(USERNAME_SELECTOR)
+    await username_input.wait_for(state="visible", timeout=10_000)
+    await username_input.fill(username)
+    await page.locator(PASSWORD_SELECTOR).fill(password)
+    await page.locator(SUBMIT_SELECTOR).click()
     await page.wait_for_url("**/home**", timeout=30_000)
 
     logger.info("login_succeeded", domain=config.domain)
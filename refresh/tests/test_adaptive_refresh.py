@@ -1,13 +1,21 @@
 """Tests for ADR-0003: adaptive scheduled refresh."""
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from pathlib import Path
 
 import pytest
 
-from refresh.scheduler import MAX_INTERVAL, MIN_INTERVAL, calculate_next_refresh
+from refresh.cookie_store import save_cookies_with_metadata
+from refresh.scheduler import (
+    MAX_INTERVAL,
+    MIN_INTERVAL,
+    acalculate_next_refresh,
+    calculate_next_refresh,
+    calculate_next_refresh_from_metadata,
+)
 
 
 def _write_cookie_file(cookie_dir: Path, domain: str, cookies: list[dict]) -> None:
@@ -59,3 +67,39 @@ def test_earliest_expiry_used(cookie_dir):
         {"name": "b", "expires": time.time() + 48 * 3600},
     ])
     assert calculate_next_refresh("nrc.nl", cookie_dir) == MIN_INTERVAL
+
+
+def test_metadata_interval_matches_file(cookie_dir):
+    cookies = [
+        {"name": "a", "value": "1", "expires": time.time() + 24 * 3600},
+        {"name": "b", "value": "2", "expires": time.time() + 48 * 3600},
+    ]
+    metadata = save_cookies_with_metadata("nrc.nl", cookies, cookie_dir)
+    result = calculate_next_refresh_from_metadata("nrc.nl", metadata, time.time())
+    assert 17.9 * 3600 < result < 18.1 * 3600
+
+
+def test_metadata_interval_ignores_already_expired_cookie(cookie_dir):
+    cookies = [
+        {"name": "stale", "value": "0", "expires": time.time() - 3600},
+        {"name": "a", "value": "1", "expires": time.time() + 24 * 3600},
+    ]
+    metadata = save_cookies_with_metadata("nrc.nl", cookies, cookie_dir)
+    from_metadata = calculate_next_refresh_from_metadata(
+        "nrc.nl", metadata, time.time()
+    )
+    from_file = calculate_next_refresh("nrc.nl", cookie_dir)
+    assert abs(from_metadata - from_file) < 5
+    assert 17.9 * 3600 < from_metadata < 18.1 * 3600
+
+
+def test_metadata_interval_expired_returns_zero():
+    metadata = {"min_expires": time.time() - 60}
+    assert calculate_next_refresh_from_metadata("nrc.nl", metadata, time.time()) == 0.0
+
+
+def test_async_variant_matches_sync(cookie_dir):
+    _write_cookie_file(
+        cookie_dir, "nrc.nl", [{"name": "s", "expires": time.time() + 30 * 24 * 3600}]
+    )
+    assert asyncio.run(acalculate_next_refresh("nrc.nl", cookie_dir)) == MAX_INTERVAL
@@ -0,0 +1,96 @@
+"""Tests for refresh service configuration loading."""
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from refresh.config import Config, SiteConfig, load_config, parse_interval
+
+
+def _site(**overrides) -> dict:
+    site = {
+        "domain": "nrc.nl",
+        "login_url": "https://login.nrc.nl",
+        "auth": {"type": "credentials", "username_env": "U", "password_env": "P"},
+    }
+    site.update(overrides)
+    return site
+
+
+@pytest.mark.parametrize(
+    ("value", "seconds"),
+    [("45s", 45), ("30m", 1800), ("12h", 43200), ("1d", 86400)],
+)
+def test_parse_interval(value, seconds):
+    assert parse_interval(value) == seconds
+
+
+@pytest.mark.parametrize("value", ["", "12", "h", "0h", "-1h", "1.5h", "12w"])
+def test_parse_interval_invalid(value):
+    with pytest.raises(ValueError):
+        parse_interval(value)
+
+
+def test_refresh_interval_seconds():
+    site = SiteConfig.model_validate(_site(refresh_interval="24h"))
+    assert site.refresh_interval_seconds == 24 * 3600
+
+
+def test_script_module_name():
+    site = SiteConfig.model_validate(_site())
+    assert site.script_module_name == "refresh.scripts.nrc_nl"
+    assert "script_module_name" not in site.model_dump()
+
+
+def test_missing_credentials(monkeypatch):
+    monkeypatch.setenv("U", "user")
+    monkeypatch.delenv("P", raising=False)
+    site = SiteConfig.model_validate(_site())
+    assert site.missing_credentials() == ["P"]
+
+    monkeypatch.setenv("P", "secret")
+    assert site.missing_credentials() == []
+
+
+def test_missing_credentials_ignored_for_oauth(monkeypatch):
+    monkeypatch.delenv("U", raising=False)
+    site = SiteConfig.model_validate(_site(auth={"type": "oauth", "username_env": "U"}))
+    assert site.missing_credentials() == []
+
+
+def test_invalid_refresh_interval_raises_on_access():
+    site = SiteConfig.model_validate(_site(refresh_interval="1.5h"))
+    with pytest.raises(ValueError):
+        site.refresh_interval_seconds
+
+
+def test_config_round_trips():
+    config = Config.model_validate({"sites": [_site()]})
+    config.sites[0].refresh_interval_seconds  # populate the cached property
+    assert Config.model_validate(config.model_dump()) == config
+
+
+def test_unknown_site_key_rejected():
+    with pytest.raises(ValidationError):
+        SiteConfig.model_validate(_site(refresh_every="12h"))
+
+
+def test_config_is_frozen():
+    config = Config.model_validate({"sites": [_site()]})
+    with pytest.raises(ValidationError):
+        config.sites[0].domain = "fd.nl"
+
+
+def test_load_config(tmp_path):
+    path = tmp_path / "sites.yaml"
+    path.write_text(
+        "sites:\n"
+        "  - domain: nrc.nl\n"
+        "    login_url: https://login.nrc.nl\n"
+        "    auth:\n"
+        "      type: credentials\n"
+        "    refresh_interval: 6h\n"
+    )
+    config = load_config(str(path))
+    assert [s.domain for s in config.sites] == ["nrc.nl"]
+    assert config.sites[0].refresh_interval_seconds == 6 * 3600
@@ -2,11 +2,14 @@
 from __future__ import annotations
 
 import json
+import os
+import stat
 import time
 
 import pytest
 
-from refresh.cookie_store import load_cookies, save_cookies_with_metadata
+from refresh import cookie_store
+from refresh.cookie_store import load_cookies, save_cookies_with_metadata, utc_z
 
 
 @pytest.fixture()
@@ -28,10 +31,20 @@ def test_adr004_format(cookie_dir):
     assert "cookies" in data
     assert "metadata" in data
     assert data["metadata"]["refresh_source"] == "manual"
-    assert "refreshed_at" in data["metadata"]
+    assert isinstance(data["metadata"]["refreshed_at"], int)
+    assert abs(data["metadata"]["refreshed_at"] - time.time()) < 5
+    assert "refreshed_at_iso" not in data["metadata"]
     assert data["metadata"]["session_cookie_workaround"] is True
 
 
+def test_human_readable_refreshed_at(cookie_dir):
+    cookies = [{"name": "s", "value": "v", "expires": time.time() + 3600}]
+    metadata = save_cookies_with_metadata(
+        "nrc.nl", cookies, cookie_dir, human_readable=True
+    )
+    assert metadata["refreshed_at_iso"] == utc_z(metadata["refreshed_at"])
+
+
 def test_session_workaround_on_save(cookie_dir):
     cookies = [{"name": "s", "value": "v", "domain": ".nrc.nl", "expires": -1}]
     save_cookies_with_metadata("nrc.nl", cookies, cookie_dir)
@@ -57,3 +70,40 @@ def test_load_round_trip(cookie_dir):
     assert len(loaded) == 1
     assert loaded[0]["name"] == "a"
     assert "refreshed_at" in metadata
+
+
+def test_stale_tmp_file_replaced(cookie_dir):
+    (cookie_dir / "nrc.nl.json.tmp").write_text("garbage")
+    cookies = [{"name": "s", "value": "v", "expires": time.time() + 3600}]
+    save_cookies_with_metadata("nrc.nl", cookies, cookie_dir)
+    loaded, _ = load_cookies(cookie_dir / "nrc.nl.json")
+    assert loaded[0]["name"] == "s"
+    assert not (cookie_dir / "nrc.nl.json.tmp").exists()
+
+
+def test_corrupted_write_keeps_existing_file(cookie_dir, monkeypatch):
+    cookies = [{"name": "old", "value": "v", "expires": time.time() + 3600}]
+    save_cookies_with_metadata("nrc.nl", cookies, cookie_dir)
+    before = (cookie_dir / "nrc.nl.json").read_bytes()
+
+    monkeypatch.setattr(cookie_store, "_read_bytes", lambda path: b"corrupted")
+    with pytest.raises(OSError):
+        save_cookies_with_metadata("nrc.nl", [], cookie_dir)
+
+    assert (cookie_dir / "nrc.nl.json").read_bytes() == before
+    assert not (cookie_dir / "nrc.nl.json.tmp").exists()
+
+
+def test_utc_z():
+    assert utc_z(1771669800.9) == "2026-02-21T10:30:00Z"
+
+
+def test_saved_file_readable_by_others(cookie_dir):
+    old_umask = os.umask(0o022)
+    try:
+        cookies = [{"name": "s", "value": "v", "expires": time.time() + 3600}]
+        save_cookies_with_metadata("nrc.nl", cookies, cookie_dir)
+    finally:
+        os.umask(old_umask)
+    mode = stat.S_IMODE((cookie_dir / "nrc.nl.json").stat().st_mode)
+    assert mode == 0o644
@@ -0,0 +1,66 @@
+"""Tests for the shared Playwright browser used by login flows."""
+from __future__ import annotations
+
+import asyncio
+
+from refresh.refresh import SharedBrowser
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.connected = True
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    async def close(self) -> None:
+        self.connected = False
+
+
+class _FakeBrowserType:
+    def __init__(self) -> None:
+        self.launched: list[_FakeBrowser] = []
+
+    async def launch(self, headless: bool) -> _FakeBrowser:
+        browser = _FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+
+def test_browser_reused_while_connected():
+    browser_type = _FakeBrowserType()
+    shared = SharedBrowser(browser_type)
+
+    async def run():
+        return await shared.get(), await shared.get()
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert len(browser_type.launched) == 1
+
+
+def test_browser_relaunched_after_disconnect():
+    browser_type = _FakeBrowserType()
+    shared = SharedBrowser(browser_type)
+
+    async def run():
+        first = await shared.get()
+        first.connected = False  # Chromium crashed
+        return first, await shared.get()
+
+    first, second = asyncio.run(run())
+    assert second is not first
+    assert second.is_connected()
+    assert len(browser_type.launched) == 2
+
+
+def test_concurrent_callers_share_one_launch():
+    browser_type = _FakeBrowserType()
+    shared = SharedBrowser(browser_type)
+
+    async def run():
+        return await asyncio.gather(*(shared.get() for _ in range(5)))
+
+    browsers = asyncio.run(run())
+    assert all(b is browsers[0] for b in browsers)
+    assert len(browser_type.launched) == 1
@@ -14,8 +14,9 @@ def test_session_cookie_gets_explicit_expiry():
     cookies = [
         {"name": "session_id", "value": "abc", "domain": ".nrc.nl", "expires": -1}
     ]
-    result = apply_session_cookie_workaround(cookies)
+    result, converted = apply_session_cookie_workaround(cookies)
     assert len(result) == 1
+    assert converted == 1
     assert result[0]["expires"] > before
     assert result[0]["expires"] <= before + SESSION_COOKIE_TTL_SECONDS + 5
 
@@ -23,8 +24,9 @@ def test_session_cookie_gets_explicit_expiry():
 def test_persistent_cookie_unchanged():
     original_expiry = int(time.time()) + 7 * 24 * 3600
     cookies = [{"name": "pref", "value": "xyz", "expires": original_expiry}]
-    result = apply_session_cookie_workaround(cookies)
+    result, converted = apply_session_cookie_workaround(cookies)
     assert result[0]["expires"] == original_expiry
+    assert converted == 0
 
 
 def test_mixed_cookies_only_session_modified():
@@ -33,7 +35,8 @@ def test_mixed_cookies_only_session_modified():
         {"name": "session", "value": "s", "expires": -1},
         {"name": "pref", "value": "p", "expires": original_expiry},
     ]
-    result = apply_session_cookie_workaround(cookies)
+    result, converted = apply_session_cookie_workaround(cookies)
+    assert converted == 1
     session = next(c for c in result if c["name"] == "session")
     pref = next(c for c in result if c["name"] == "pref")
     assert session["expires"] > time.time()
@@ -45,3 +48,10 @@ def test_original_list_not_mutated():
     original_expires = cookies[0]["expires"]
     apply_session_cookie_workaround(cookies)
     assert cookies[0]["expires"] == original_expires
+
+
+def test_no_session_cookies_returns_input():
+    cookies = [{"name": "pref", "value": "p", "expires": int(time.time()) + 3600}]
+    result, converted = apply_session_cookie_workaround(cookies)
+    assert result is cookies
+    assert converted == 0